@@ -51,15 +51,31 @@ python3 omenloader.py timeseries \
 
 import argparse
 import csv
+import functools
 import math
+import os
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+# Scalar or column-wise numeric input (float, np.ndarray, pd.Series).
+ArrayLike = Union[float, np.ndarray, pd.Series]
+
 DEFAULT_DB = "/opt/homebrew/var/lib/grafana/omen.db"
 
+# SQLite fsync policy for loader connections; set OMEN_SQLITE_SYNCHRONOUS=FULL
+# to get SQLite's default durability back.
+SQLITE_SYNCHRONOUS = os.environ.get("OMEN_SQLITE_SYNCHRONOUS", "NORMAL").upper()
+
+# Seconds a connection waits on a locked DB before raising "database is locked":
+# another loader process holding the write lock, or, for checkpoint_wal(), readers
+# such as Grafana still using the WAL.
+SQLITE_BUSY_TIMEOUT_S = 120.0
+
 # Columns that represent loss percentages in the CSV (0-100) that we want as 0-1.
 LOSS_PERCENT_COLUMNS = [
     "loss_pct",
@@ -93,38 +109,106 @@ def ensure_parent(path: Path):
 
 def open_db(db_path: Path) -> sqlite3.Connection:
     # Open SQLite with sane defaults for Grafana usage (WAL + FKs).
+    if SQLITE_SYNCHRONOUS not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+        raise ValueError(f"OMEN_SQLITE_SYNCHRONOUS must be OFF, NORMAL, FULL or EXTRA (got {SQLITE_SYNCHRONOUS!r})")
     ensure_parent(db_path)
-    conn = sqlite3.connect(str(db_path))
+    # Autocommit mode (isolation_level=None): writers wrap their batches in
+    # transaction() instead of relying on sqlite3's implicit BEGIN handling.
+    # A larger statement cache keeps the per-table INSERTs prepared, and the
+    # busy timeout lets a concurrent loader run queue for the write lock.
+    conn = sqlite3.connect(str(db_path), isolation_level=None, cached_statements=512,
+                           timeout=SQLITE_BUSY_TIMEOUT_S)
     conn.execute("PRAGMA journal_mode=WAL;")
     conn.execute("PRAGMA foreign_keys=ON;")
+    # Bulk-ingest tuning: in WAL mode synchronous=NORMAL only fsyncs at checkpoints
+    # (a crash can lose the last commits, never corrupt the DB); 64 MiB page cache,
+    # in-memory temp tables, 256 MiB mmap, and fewer, larger auto-checkpoints.
+    conn.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS};")
+    conn.execute("PRAGMA cache_size=-65536;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA mmap_size=268435456;")
+    conn.execute("PRAGMA wal_autocheckpoint=10000;")
     return conn
 
+def checkpoint_wal(conn: sqlite3.Connection):
+    # Copy the WAL back into the main DB file and truncate it once a load is
+    # done, so the -wal file does not stay at its high-water mark between runs.
+    # Waits (busy timeout) for active readers such as Grafana queries to finish;
+    # if they outlast it, SQLite reports busy and the rest is left for later.
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchall()
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    # Explicit BEGIN/COMMIT (ROLLBACK on error) around a batch of writes.
+    # IMMEDIATE takes the write lock up front (waiting out other writers via the
+    # busy timeout) rather than failing on a read→write upgrade mid-batch.
+    # Nested use joins the transaction that is already open.
+    if conn.in_transaction:
+        yield
+        return
+    conn.execute("BEGIN IMMEDIATE;")
+    try:
+        yield
+        conn.execute("COMMIT;")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK;")
+        raise
+
 def resolve_path(p: Union[str, Path], root: Path) -> Path:
     # Resolve a possibly-relative path against --root.
     p = Path(p)
     return p if p.is_absolute() else (root / p)
 
+_QIDENT_CACHE: Dict[str, str] = {}
+
 def qident(name: str) -> str:
     # Quote an identifier for SQLite (avoids clashes / reserved words).
-    return '"' + name.replace('"', '""') + '"'
-
-def to_int(s: Optional[str]) -> Optional[int]:
-    # Best-effort int parsing with None/null/'' tolerance.
-    if s is None or s == "" or str(s).lower() == "null":
-        return None
-    try:
-        return int(float(s))
-    except ValueError:
-        return None
-
-def to_float(s: Optional[str]) -> Optional[float]:
-    # Best-effort float parsing with None/null./'' tolerance.
-    if s is None or s == "" or str(s).lower() == "null":
-        return None
-    try:
-        return float(s)
-    except ValueError:
-        return None
+    # Memoized: the same handful of table/index names are quoted over and over.
+    quoted = _QIDENT_CACHE.get(name)
+    if quoted is None:
+        quoted = _QIDENT_CACHE[name] = '"' + name.replace('"', '""') + '"'
+    return quoted
+
+# Null spellings in numeric CSV fields; read as NaN/NULL rather than parsed.
+_NULLS = frozenset(("", "null", "NULL", "Null", "None"))
+
+def header_index(header: List[str]) -> Tuple[int, Callable[[str], int]]:
+    # Map CSV column names to positions once per file, so rows can be read with
+    # csv.reader + integer indexing instead of a DictReader dict per row.
+    # Missing columns resolve to index `width`, a trailing "" cell added by pad_row().
+    width = len(header)
+    positions = {name: i for i, name in enumerate(header)}
+    return width, lambda name: positions.get(name, width)
+
+def pad_row(row: List[str], width: int):
+    # Extend a csv.reader row in place so every header_index() position is valid
+    # (short rows get "" like DictReader's missing fields; one "" cell for absent columns).
+    n = len(row)
+    if n <= width:
+        row.extend([""] * (width + 1 - n))
+    elif n > width + 1 or row[width]:
+        del row[width:]
+        row.append("")
+
+def _column_values(col: pd.Series) -> list:
+    # One column as plain Python values for executemany(), converted like
+    # DataFrame.to_sql does for sqlite3: datetime64 → ISO text via
+    # datetime.isoformat(" "), timedelta64 → integer ticks of the column's unit.
+    # NaN/NA/NaT become None (to_sql would store NaT timedeltas as INT64_MIN).
+    missing = col.isna().tolist()
+    if col.dtype.kind == "M":
+        stamps = col.dt.to_pydatetime()
+        return [None if na else ts.isoformat(" ") for ts, na in zip(stamps, missing)]
+    if col.dtype.kind == "m":
+        ticks = col.to_numpy().view("i8").tolist()
+        return [None if na else t for t, na in zip(ticks, missing)]
+    return col.astype(object).where(col.notna(), None).tolist()
+
+def frame_rows(df: pd.DataFrame) -> Iterator[tuple]:
+    # Row tuples of plain Python values (see _column_values) ready for
+    # executemany(), built column-at-a-time rather than through itertuples().
+    return zip(*(_column_values(df[c]) for c in df.columns))
 
 # ------------------------ Geo helpers (graph) ------------------------
 
@@ -141,47 +225,77 @@ def parse_position_xyz(pos: Optional[str]) -> Tuple[Optional[float], Optional[fl
     except Exception:
         return None, None, None
 
-def cartesian_to_geo(x_m: float, y_m: float, base_lat: float, base_lon: float) -> Tuple[float, float]:
+def parse_position_xyz_series(pos: pd.Series) -> pd.DataFrame:
+    # parse_position_xyz over a whole 'position' column, collected into float
+    # columns x, y, z (NaN where missing/invalid) for the array geo math.
+    # One pass of the scalar parser over the plain str values is faster than
+    # pandas' str.split(expand=True) + to_numeric, and matches it by construction.
+    xyz = [parse_position_xyz(p) if isinstance(p, str) else (None, None, None)
+           for p in pos.tolist()]
+    return pd.DataFrame(xyz, columns=["x", "y", "z"], index=pos.index, dtype=float)
+
+METERS_PER_DEG_LAT = 111_320.0
+
+def cartesian_to_geo(x_m: ArrayLike, y_m: ArrayLike, base_lat: float, base_lon: float) -> Tuple[ArrayLike, ArrayLike]:
     # Convert local (x east, y north) meters into lat/lon degrees around a base origin.
     # Good enough for small campus-scale offsets.
-    meters_per_deg_lat = 111_320.0
-    meters_per_deg_lon = 111_320.0 * math.cos(math.radians(base_lat))
-    lat = base_lat + (y_m / meters_per_deg_lat)
+    # x_m/y_m may be scalars or whole NumPy/pandas columns; the cos() term only
+    # depends on base_lat, so it is evaluated once per call, not per element.
+    meters_per_deg_lon = METERS_PER_DEG_LAT * math.cos(math.radians(base_lat))
+    lat = base_lat + (y_m / METERS_PER_DEG_LAT)
     lon = base_lon + (x_m / meters_per_deg_lon)
     return lat, lon
 
-def guess_subtitle(node_id: Optional[str]) -> str:
-    # Cheap labeler for node type; used if subTitle not provided. 
-    if not node_id:
-        return "network node"
-    nid = node_id.lower()
-    if nid.startswith("ap"):
-        return "access point"
-    if nid.startswith("sta"):
-        return "station"
-    return "network node"
+# Node-type labels by (case-insensitive) id prefix, first match wins.
+SUBTITLE_BY_ID_PREFIX = (("ap", "access point"), ("sta", "station"))
+DEFAULT_SUBTITLE = "network node"
+
+def guess_subtitle_series(node_ids: pd.Series) -> np.ndarray:
+    # Cheap labeler for node type over a whole id column; used where subTitle
+    # is not provided.
+    nid = node_ids.str.lower()
+    return np.select([nid.str.startswith(prefix) for prefix, _ in SUBTITLE_BY_ID_PREFIX],
+                     [label for _, label in SUBTITLE_BY_ID_PREFIX], default=DEFAULT_SUBTITLE)
+
+# Success-ratio thresholds for the Node Graph severity buckets.
+SEVERITY_OK_AT = 0.9
+SEVERITY_WARNING_AT = 0.6
 
 def severity_from_success(p: Optional[float]) -> str:
     # Map success ratio to severity string used by Node Graph styling. 
     if p is None:
         return "unknown"
-    if p >= 0.9:
+    if p >= SEVERITY_OK_AT:
         return "ok"
-    if p >= 0.6:
+    if p >= SEVERITY_WARNING_AT:
         return "warning"
     return "critical"
 
+# Severity labels indexed by (p >= WARNING) + (p >= OK); the last slot is for NaN.
+_SEVERITY_LABELS = np.array(["critical", "warning", "ok", "unknown"], dtype=object)
+
+def severity_from_success_series(succ: pd.Series) -> np.ndarray:
+    # Vectorized severity_from_success over a whole success-ratio column
+    # (NaN → "unknown"): two threshold compares summed into a label index and
+    # one take() into an object array, instead of a branch ladder per row.
+    p = np.asarray(succ, dtype=float)
+    codes = (p >= SEVERITY_WARNING_AT).astype(np.intp) + (p >= SEVERITY_OK_AT)
+    codes[np.isnan(p)] = len(_SEVERITY_LABELS) - 1
+    return _SEVERITY_LABELS.take(codes)
+
 # ------------------------ GRAPH: schema + ingest ------------------------
 
 def drop_and_create_schema_for_prefix(conn: sqlite3.Connection, prefix: str):
     # Drop and recreate <prefix>_nodes and <prefix>_edges.
+    # Both are WITHOUT ROWID: rows are small and keyed by a TEXT id, so one
+    # clustered B-tree on id replaces a rowid table plus a separate PK index.
     cur = conn.cursor()
-    nodes_tbl = f"{prefix}_nodes"
-    edges_tbl = f"{prefix}_edges"
-    cur.execute(f"DROP TABLE IF EXISTS {qident(edges_tbl)};")
-    cur.execute(f"DROP TABLE IF EXISTS {qident(nodes_tbl)};")
+    nodes_tbl = qident(f"{prefix}_nodes")
+    edges_tbl = qident(f"{prefix}_edges")
+    cur.execute(f"DROP TABLE IF EXISTS {edges_tbl};")
+    cur.execute(f"DROP TABLE IF EXISTS {nodes_tbl};")
     cur.execute(f"""
-    CREATE TABLE {qident(nodes_tbl)} (
+    CREATE TABLE {nodes_tbl} (
         id                   TEXT PRIMARY KEY,
         title                TEXT,
         subTitle             TEXT,
@@ -196,25 +310,24 @@ def drop_and_create_schema_for_prefix(conn: sqlite3.Connection, prefix: str):
         arc__errors          REAL,
         latitude             REAL,
         longitude            REAL
-    );""")
+    ) WITHOUT ROWID;""")
     cur.execute(f"""
-    CREATE TABLE {qident(edges_tbl)} (
+    CREATE TABLE {edges_tbl} (
         id      TEXT PRIMARY KEY,
         source  TEXT NOT NULL,
         target  TEXT NOT NULL,
         status  TEXT,
-        FOREIGN KEY(source) REFERENCES {qident(nodes_tbl)}(id) ON DELETE CASCADE ON UPDATE CASCADE,
-        FOREIGN KEY(target) REFERENCES {qident(nodes_tbl)}(id) ON DELETE CASCADE ON UPDATE CASCADE
-    );""")
-    conn.commit()
+        FOREIGN KEY(source) REFERENCES {nodes_tbl}(id) ON DELETE CASCADE ON UPDATE CASCADE,
+        FOREIGN KEY(target) REFERENCES {nodes_tbl}(id) ON DELETE CASCADE ON UPDATE CASCADE
+    ) WITHOUT ROWID;""")
 
 def ensure_schema_for_prefix(conn: sqlite3.Connection, prefix: str):
     # Create <prefix>_nodes and <prefix>_edges if they do not exist.
     cur = conn.cursor()
-    nodes_tbl = f"{prefix}_nodes"
-    edges_tbl = f"{prefix}_edges"
+    nodes_tbl = qident(f"{prefix}_nodes")
+    edges_tbl = qident(f"{prefix}_edges")
     cur.execute(f"""
-    CREATE TABLE IF NOT EXISTS {qident(nodes_tbl)} (
+    CREATE TABLE IF NOT EXISTS {nodes_tbl} (
         id                   TEXT PRIMARY KEY,
         title                TEXT,
         subTitle             TEXT,
@@ -229,118 +342,233 @@ def ensure_schema_for_prefix(conn: sqlite3.Connection, prefix: str):
         arc__errors          REAL,
         latitude             REAL,
         longitude            REAL
-    );""")
+    ) WITHOUT ROWID;""")
     cur.execute(f"""
-    CREATE TABLE IF NOT EXISTS {qident(edges_tbl)} (
+    CREATE TABLE IF NOT EXISTS {edges_tbl} (
         id      TEXT PRIMARY KEY,
         source  TEXT NOT NULL,
         target  TEXT NOT NULL,
         status  TEXT
-    );""")
-    conn.commit()
+    ) WITHOUT ROWID;""")
+
+NODE_COLUMNS = [
+    "id", "title", "subTitle", "mainStat", "severity",
+    "detail__rx_bytes", "detail__rx_packets", "detail__tx_bytes", "detail__tx_packets",
+    "detail__success_rate", "arc__success", "arc__errors", "latitude", "longitude",
+]
+EDGE_COLUMNS = ["id", "source", "target", "status"]
+
+def _insert_templates(columns: List[str]) -> Tuple[str, str]:
+    # (INSERT OR REPLACE, UPSERT) SQL templates for `columns`, keyed on id;
+    # `{table}` is filled in per prefix.
+    cols = ", ".join(columns)
+    params = ",".join("?" * len(columns))
+    updates = ",\n      ".join(f"{c}=excluded.{c}" for c in columns if c != "id")
+    insert = f"INSERT OR REPLACE INTO {{table}} ({cols}) VALUES ({params});"
+    upsert = f"""
+    INSERT INTO {{table}} ({cols}) VALUES ({params})
+    ON CONFLICT(id) DO UPDATE SET
+      {updates};
+    """
+    return insert, upsert
+
+_NODE_INSERT_SQL, _NODE_UPSERT_SQL = _insert_templates(NODE_COLUMNS)
+_EDGE_INSERT_SQL, _EDGE_UPSERT_SQL = _insert_templates(EDGE_COLUMNS)
+
+@functools.lru_cache(maxsize=None)
+def _nodes_insert_sql(table: str, recreate: bool) -> str:
+    # INSERT statement for <prefix>_nodes, built once per (table, mode); the
+    # identical string each call keeps sqlite3's prepared-statement cache hot.
+    # A freshly recreated table is empty, so the ON CONFLICT ... DO UPDATE SET
+    # excluded.* clause is dead weight per row; INSERT OR REPLACE keeps
+    # last-row-wins for duplicate ids in the CSV.
+    return (_NODE_INSERT_SQL if recreate else _NODE_UPSERT_SQL).format(table=qident(table))
+
+@functools.lru_cache(maxsize=None)
+def _edges_insert_sql(table: str, recreate: bool) -> str:
+    # INSERT statement for <prefix>_edges (see _nodes_insert_sql).
+    return (_EDGE_INSERT_SQL if recreate else _EDGE_UPSERT_SQL).format(table=qident(table))
+
+def executemany_chunked(conn: sqlite3.Connection, sql: str, rows: Iterable[tuple],
+                        chunksize: int = 5000) -> int:
+    # executemany() over a row stream in batches of `chunksize`, all inside one
+    # transaction: peak memory stays O(chunk) instead of O(file). Returns rows sent.
+    count = 0
+    buf = []
+    with transaction(conn):
+        for row in rows:
+            buf.append(row)
+            if len(buf) >= chunksize:
+                conn.executemany(sql, buf)
+                count += len(buf)
+                buf.clear()
+        if buf:
+            conn.executemany(sql, buf)
+            count += len(buf)
+    return count
+
+# nodes.csv columns ingest_nodes reads. The text ones stay str; the numeric
+# ones are parsed by the C reader with the _NULLS tokens as NaN, so
+# only columns holding junk values fall back to pd.to_numeric on strings.
+NODE_CSV_TEXT_COLUMNS = ("id", "title", "subTitle", "position")
+NODE_CSV_NUMERIC_COLUMNS = ("rx_bytes", "rx_packets", "tx_bytes", "tx_packets",
+                            "success_pct_rate", "latitude", "longitude")
+
+def _node_frame(df: pd.DataFrame, base_lat: float, base_lon: float,
+                prefer_pos_over_latlon: bool) -> pd.DataFrame:
+    # Vectorized nodes.csv → <prefix>_nodes columns for one chunk of rows
+    # (str or already-numeric input; same rules as the scalar helpers, a
+    # column at a time).
+    def col(name: str) -> pd.Series:
+        return df[name] if name in df.columns else pd.Series("", index=df.index, dtype=str)
+
+    def ints(name: str) -> pd.Series:
+        v = pd.to_numeric(col(name), errors="coerce").replace([np.inf, -np.inf], np.nan)
+        return np.trunc(v).astype("Int64")
+
+    def floats(name: str) -> pd.Series:
+        return pd.to_numeric(col(name), errors="coerce").astype(float)
+
+    nid = col("id")
+    keep = nid != ""
+    df, nid = df[keep], nid[keep]
+
+    title = col("title")
+    sub_title = col("subTitle")
+    succ = floats("success_pct_rate")
+
+    # Choose coordinate source per row: position → (lat,lon) else provided lat/lon
+    xyz = parse_position_xyz_series(col("position"))
+    has_pos = xyz["x"].notna() & xyz["y"].notna()
+    csv_lat, csv_lon = floats("latitude"), floats("longitude")
+    use_pos = has_pos & (prefer_pos_over_latlon | csv_lat.isna() | csv_lon.isna())
+    pos_lat, pos_lon = cartesian_to_geo(xyz["x"], xyz["y"], base_lat, base_lon)
+
+    return pd.DataFrame({
+        "id": nid,
+        "title": title.where(title != "", nid),
+        "subTitle": sub_title.where(sub_title != "", pd.Series(guess_subtitle_series(nid), index=df.index)),
+        "mainStat": succ,
+        "severity": severity_from_success_series(succ),
+        "detail__rx_bytes": ints("rx_bytes"),
+        "detail__rx_packets": ints("rx_packets"),
+        "detail__tx_bytes": ints("tx_bytes"),
+        "detail__tx_packets": ints("tx_packets"),
+        "detail__success_rate": succ,
+        "arc__success": succ,
+        "arc__errors": 1.0 - succ,
+        "latitude": pos_lat.where(use_pos, csv_lat),
+        "longitude": pos_lon.where(use_pos, csv_lon),
+    }, columns=NODE_COLUMNS)
 
 def ingest_nodes(conn: sqlite3.Connection, prefix: str, csv_path: Path,
-                 base_lat: float, base_lon: float, prefer_pos_over_latlon: bool = True) -> int:
+                 base_lat: float, base_lon: float, prefer_pos_over_latlon: bool = True,
+                 recreate: bool = False, chunksize: int = 5000) -> int:
     
     # Insert/UPSERT rows from nodes.csv into <prefix>_nodes.
     # - Derives (lat,lon) from 'position' when available; falls bck to CSV lat/lon.
     # - Computes mainStat/severity/arcs from sucess_pct_rate for Node Graph visuals.
-    table = f"{prefix}_nodes"
-    cur = conn.cursor()
+    # - Reads `chunksize` rows at a time with pandas (numeric columns typed by
+    #   the C parser) and derives every column vectorized; each chunk goes to
+    #   one executemany() in a single transaction.
+    sql = _nodes_insert_sql(f"{prefix}_nodes", recreate)
     count = 0
-    with csv_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            nid = row.get("id")
-            if not nid:
-                continue
-            title = row.get("title") or nid
-            sub_title = row.get("subTitle") or guess_subtitle(nid)
-            rx_b = to_int(row.get("rx_bytes"))
-            rx_p = to_int(row.get("rx_packets"))
-            tx_b = to_int(row.get("tx_bytes"))
-            tx_p = to_int(row.get("tx_packets"))
-            succ = to_float(row.get("success_pct_rate"))
-            main_stat = succ
-            severity = severity_from_success(succ)
-            arc_success = succ
-            arc_errors = (1.0 - succ) if succ is not None else None
-            
-            # Choose coordinate source: position → (lat,lon) else provided lat/lon
-            lat = None
-            lon = None
-            x, y, _ = parse_position_xyz(row.get("position"))
-            if prefer_pos_over_latlon and x is not None and y is not None:
-                lat, lon = cartesian_to_geo(x, y, base_lat, base_lon)
-            else:
-                lat = to_float(row.get("latitude"))
-                lon = to_float(row.get("longitude"))
-                if (lat is None or lon is None) and x is not None and y is not None:
-                    lat, lon = cartesian_to_geo(x, y, base_lat, base_lon)
-
-            cur.execute(f"""
-            INSERT INTO {qident(table)} (
-              id, title, subTitle, mainStat, severity,
-              detail__rx_bytes, detail__rx_packets, detail__tx_bytes, detail__tx_packets,
-              detail__success_rate, arc__success, arc__errors, latitude, longitude
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            ON CONFLICT(id) DO UPDATE SET
-              title=excluded.title,
-              subTitle=excluded.subTitle,
-              mainStat=excluded.mainStat,
-              severity=excluded.severity,
-              detail__rx_bytes=excluded.detail__rx_bytes,
-              detail__rx_packets=excluded.detail__rx_packets,
-              detail__tx_bytes=excluded.detail__tx_bytes,
-              detail__tx_packets=excluded.detail__tx_packets,
-              detail__success_rate=excluded.detail__success_rate,
-              arc__success=excluded.arc__success,
-              arc__errors=excluded.arc__errors,
-              latitude=excluded.latitude,
-              longitude=excluded.longitude;
-            """, (nid, title, sub_title, main_stat, severity,
-                  rx_b, rx_p, tx_b, tx_p, succ, arc_success, arc_errors, lat, lon))
-            count += 1
-    conn.commit()
+    try:
+        # index_col=False: rows with extra trailing fields (a trailing comma, an
+        # unquoted x,y,z position) are truncated like DictReader's extras instead
+        # of pandas promoting the first column to the index and shifting the rest.
+        chunks = pd.read_csv(
+            csv_path,
+            index_col=False,
+            usecols=lambda c: c in NODE_CSV_TEXT_COLUMNS or c in NODE_CSV_NUMERIC_COLUMNS,
+            dtype={c: str for c in NODE_CSV_TEXT_COLUMNS},
+            keep_default_na=False,
+            na_values={c: list(_NULLS) for c in NODE_CSV_NUMERIC_COLUMNS},
+            chunksize=chunksize,
+        )
+    except pd.errors.EmptyDataError:
+        # No header at all: nothing to load, same as an empty DictReader.
+        return 0
+    with transaction(conn), chunks:
+        for chunk in chunks:
+            nodes = _node_frame(chunk, base_lat, base_lon, prefer_pos_over_latlon)
+            conn.executemany(sql, frame_rows(nodes))
+            count += len(nodes)
     return count
 
-def ingest_edges(conn: sqlite3.Connection, prefix: str, csv_path: Path) -> int:
+def _edge_rows(reader: Iterator[List[str]]) -> Iterator[tuple]:
+    # Turn edges.csv rows into <prefix>_edges tuples (see ingest_edges).
+    header = next(reader, [])
+    width, idx = header_index(header)
+    ID, STATUS = idx("id"), idx("status")
+
+    def aliases(*names: str) -> Tuple[int, List[int]]:
+        # Resolve a column's name variants once: the first one present in the
+        # header, plus any others (rarely more than one) as per-row fallbacks.
+        cols = [i for i in map(idx, names) if i != width] or [width]
+        return cols[0], cols[1:]
+
+    SRC, SRC_ALT = aliases("source", "sourse", "src")
+    TGT, TGT_ALT = aliases("target", "destination", "dst")
+    for row in reader:
+        pad_row(row, width)
+        edge_id = row[ID]
+        src = row[SRC] or next((row[i] for i in SRC_ALT if row[i]), "")
+        tgt = row[TGT] or next((row[i] for i in TGT_ALT if row[i]), "")
+        status = row[STATUS] or "up"
+        if not src or not tgt:
+            continue
+        if not edge_id:
+            edge_id = f"{src}-{tgt}"
+        yield (edge_id, src, tgt, status)
+
+def ingest_edges(conn: sqlite3.Connection, prefix: str, csv_path: Path,
+                 recreate: bool = False, chunksize: int = 5000) -> int:
     # Insert/UPSERT rows from edges.csv into <prefix>_edges.
     # - If id missing, derive "source-target".
     # - Accepts 'source' | 'src' and 'target' | 'dst' naming variants.
-    table = f"{prefix}_edges"
-    cur = conn.cursor()
-    count = 0
-    with csv_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            edge_id = row.get("id")
-            src = row.get("source") or row.get("sourse") or row.get("src")
-            tgt = row.get("target") or row.get("destination") or row.get("dst")
-            status = row.get("status") or "up"
-            if not src or not tgt:
-                continue
-            if not edge_id:
-                edge_id = f"{src}-{tgt}"
-            cur.execute(f"""
-            INSERT INTO {qident(table)} (id, source, target, status)
-            VALUES (?,?,?,?)
-            ON CONFLICT(id) DO UPDATE SET
-              source=excluded.source,
-              target=excluded.target,
-              status=excluded.status;
-            """, (edge_id, src, tgt, status))
-            count += 1
-    conn.commit()
-    return count
+    sql = _edges_insert_sql(f"{prefix}_edges", recreate)
+    with transaction(conn), csv_path.open(newline="", encoding="utf-8") as f:
+        # FK checks against <prefix>_nodes run once at COMMIT instead of per row.
+        conn.execute("PRAGMA defer_foreign_keys=ON;")
+        return executemany_chunked(conn, sql, _edge_rows(csv.reader(f)), chunksize)
+
+def write_frame(conn: sqlite3.Connection, table: str, df: pd.DataFrame,
+                if_exists: str = "replace") -> int:
+    # Drop-in for df.to_sql(table, conn, if_exists=..., index=False).
+    # Same table DDL and value conversions as pandas (see frame_rows), but rows
+    # are bound straight from per-column Python lists via one executemany in
+    # one transaction, skipping pandas' per-row insert adapter.
+    tbl = qident(table)
+    # Built even when appending: like to_sql, this also registers pandas'
+    # sqlite3 adapters for date/time objects held in object columns.
+    schema = pd.io.sql.get_schema(df, table, con=conn)
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?;", (table,)
+    ).fetchone() is not None
+    if exists and if_exists == "fail":
+        raise ValueError(f"Table '{table}' already exists.")
+    if exists and if_exists == "replace":
+        conn.execute(f"DROP TABLE {tbl};")
+    if not exists or if_exists == "replace":
+        conn.execute(schema)
+
+    sql = f"INSERT INTO {tbl} ({','.join(qident(str(c)) for c in df.columns)}) VALUES ({','.join('?' * len(df.columns))});"
+    with transaction(conn):
+        conn.executemany(sql, frame_rows(df))
+    return len(df)
+
+def read_timeseries_csv(csv_path: Path) -> pd.DataFrame:
+    # Read a timeseries CSV as-is, with loss percentage columns normalized
+    # into 0-1 fractions. Touches no database, so callers can run it before
+    # taking the write lock.
+    df = pd.read_csv(csv_path)
+    return normalize_loss_fraction(df)
 
 def ingest_timeseries_raw(conn: sqlite3.Connection, table: str, csv_path: Path,
                           if_exists: str = "replace") -> int:
     # Load any CSV as-is into a table (user per-set movement series).
-    df = pd.read_csv(csv_path)
-    df = normalize_loss_fraction(df)
-    df.to_sql(table, conn, if_exists=if_exists, index=False)
-    return len(df)
+    return write_frame(conn, table, read_timeseries_csv(csv_path), if_exists=if_exists)
 
 # ------------------------ Subcommand: graph ------------------------
 
@@ -375,7 +603,7 @@ def run_graph(args: argparse.Namespace):
     used = 0
 
     def process_set(idx: int):
-        # Process one of the up to three graph sets. 
+        # Process one of the up to three graph sets.
         prefix = getattr(args, f"set{idx}_prefix")
         set_dir = getattr(args, f"set{idx}_dir")
         nodes = getattr(args, f"set{idx}_nodes")
@@ -405,49 +633,94 @@ def run_graph(args: argparse.Namespace):
             raise FileNotFoundError(f"Set {idx}: nodes file not found: {nodes_path}")
         if not edges_path.exists():
             raise FileNotFoundError(f"Set {idx}: edges file not found: {edges_path}")
-
-        # Create/ensure schemas
-        if args.recreate:
-            drop_and_create_schema_for_prefix(conn, prefix)
-        else:
-            ensure_schema_for_prefix(conn, prefix)
-
-        # Ingest graph entities
-        lat = getattr(args, f"set{idx}_pos_base_lat")
-        lon = getattr(args, f"set{idx}_pos_base_lon")
-
-        n = ingest_nodes(conn, prefix, nodes_path, base_lat=lat, base_lon=lon)
-        e = ingest_edges(conn, prefix, edges_path)
-
-        # Optional per-set timeseries 
+        ts_path = None
         if ts:
             ts_path = resolve_path(ts, root)
             if not ts_path.exists():
                 raise FileNotFoundError(f"Set {idx}: timeseries file not found: {ts_path}")
-            ts_tbl = ts_table or f"{prefix}_timeseries"
-            rows = ingest_timeseries_raw(conn, ts_tbl, ts_path, if_exists="replace")
-            print(f"[{prefix}] loaded timeseries table={ts_tbl} rows={rows}")
 
-        # Helpful indexes for Grafana queries
-        cur = conn.cursor()
-        cur.execute(f"CREATE INDEX IF NOT EXISTS {qident(f'idx_{prefix}_nodes_id')} ON {qident(prefix+'_nodes')}(id);")
-        cur.execute(f"CREATE INDEX IF NOT EXISTS {qident(f'idx_{prefix}_edges_src')} ON {qident(prefix+'_edges')}(source);")
-        cur.execute(f"CREATE INDEX IF NOT EXISTS {qident(f'idx_{prefix}_edges_tgt')} ON {qident(prefix+'_edges')}(target);")
-        conn.commit()
+        lat = getattr(args, f"set{idx}_pos_base_lat")
+        lon = getattr(args, f"set{idx}_pos_base_lon")
+        load_set(prefix, nodes_path, edges_path, ts_path, ts_table, lat, lon)
+        return True
 
+    def load_set(prefix: str, nodes_path: Path, edges_path: Path,
+                 ts_path: Optional[Path], ts_table: str, lat: float, lon: float):
+        nodes_tbl = qident(f"{prefix}_nodes")
+        edges_tbl = qident(f"{prefix}_edges")
+        src_idx = qident(f"idx_{prefix}_edges_src")
+        tgt_idx = qident(f"idx_{prefix}_edges_tgt")
+        # Parse the optional timeseries up front, so the write lock is only held
+        # for database work.
+        ts_df = read_timeseries_csv(ts_path) if ts_path else None
+
+        # The whole set (schema, nodes, edges, indexes, timeseries, stats) is
+        # one transaction: a single commit per set, and a failure anywhere
+        # leaves the set's previous tables untouched. It is per set rather than
+        # one for the whole run so that, as before, sets that already loaded
+        # stay committed when a later set fails.
+        # FK enforcement is off for the load: a single foreign_key_check pass
+        # over the loaded edges replaces a parent lookup per edge row. The
+        # pragma is a no-op inside a transaction, so it is toggled around it.
+        conn.execute("PRAGMA foreign_keys=OFF;")
+        try:
+            with transaction(conn):
+                # Create/ensure schemas
+                if args.recreate:
+                    drop_and_create_schema_for_prefix(conn, prefix)
+                else:
+                    ensure_schema_for_prefix(conn, prefix)
+
+                # No index on <prefix>_nodes(id): the PRIMARY KEY already has its
+                # own B-tree. Drop the one older loader versions created.
+                conn.execute(f"DROP INDEX IF EXISTS {qident(f'idx_{prefix}_nodes_id')};")
+                # Edge indexes (for Grafana queries) are rebuilt in one sorted
+                # pass after the load instead of being updated per inserted row.
+                conn.execute(f"DROP INDEX IF EXISTS {src_idx};")
+                conn.execute(f"DROP INDEX IF EXISTS {tgt_idx};")
+
+                # Ingest graph entities
+                n = ingest_nodes(conn, prefix, nodes_path, base_lat=lat, base_lon=lon, recreate=args.recreate)
+                e = ingest_edges(conn, prefix, edges_path, recreate=args.recreate)
+
+                dangling = conn.execute(f"PRAGMA foreign_key_check({edges_tbl});").fetchall()
+                if dangling:
+                    raise ValueError(f"[{prefix}] {len(dangling)} edge endpoint(s) reference ids missing from {prefix}_nodes")
+
+                conn.execute(f"CREATE INDEX {src_idx} ON {edges_tbl}(source);")
+                conn.execute(f"CREATE INDEX {tgt_idx} ON {edges_tbl}(target);")
+
+                # Optional per-set timeseries
+                if ts_df is not None:
+                    rows = write_frame(conn, ts_table, ts_df, if_exists="replace")
+
+                # Refresh planner stats so Grafana's joins pick the edge indexes.
+                conn.execute(f"ANALYZE {nodes_tbl};")
+                conn.execute(f"ANALYZE {edges_tbl};")
+        finally:
+            conn.execute("PRAGMA foreign_keys=ON;")
+
+        if ts_df is not None:
+            print(f"[{prefix}] loaded timeseries table={ts_table} rows={rows}")
         print(f"[{prefix}] loaded nodes={n}, edges={e}")
-        return True
-    
-    # Process up to three sets
-    for i in (1, 2, 3):
-        if process_set(i):
-            used += 1
+
+    # Sets load one after another, in order: each holds the write lock for its
+    # whole load anyway, and a bad set stops the run before later sets are written.
+    try:
+        for i in (1, 2, 3):
+            if process_set(i):
+                used += 1
+        # Let SQLite refresh any planner stats it considers stale before closing.
+        conn.execute("PRAGMA optimize;")
+    finally:
+        # Sets that already committed get their WAL folded back even if a later one failed.
+        checkpoint_wal(conn)
+        conn.close()
 
     if used == 0:
         print("No sets provided. Use --set{1|2|3}-prefix + (--set{1|2|3}-dir OR --set{1|2|3}-nodes + --set{1|2|3}-edges) and optionally --set{1|2|3}-ts.")
     else:
         print(f"Done. Processed {used} set(s). DB: {args.db}")
-    conn.close()
 
 # ------------------------ Subcommand: timeseries ------------------------
 
@@ -471,15 +744,14 @@ def run_timeseries(args: argparse.Namespace):
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    df = pd.read_csv(csv_path)
-    # Normalize any loss percentage columns into 0-1 fractions before storing.
-    df = normalize_loss_fraction(df)
+    # Loss percentage columns come back normalized into 0-1 fractions.
+    df = read_timeseries_csv(csv_path)
     print(f"Loaded CSV with {len(df)} rows and {len(df.columns)} columns from {csv_path}.")
 
     conn = open_db(Path(args.db))
     
     # Raw table
-    df.to_sql(args.table, conn, if_exists=args.if_exists, index=False)
+    write_frame(conn, args.table, df, if_exists=args.if_exists)
     print(f"Inserted raw table '{args.table}' into {args.db}.")
     
     # Optional aggregation
@@ -487,14 +759,17 @@ def run_timeseries(args: argparse.Namespace):
         if args.aggregate_by not in df.columns:
             raise ValueError(f"Column '{args.aggregate_by}' not found in CSV columns: {list(df.columns)}")
         
-        #Keep key column; average numeric columns only
-        df_coerced = df.apply(pd.to_numeric, errors="ignore")
-        grouped = df_coerced.groupby(args.aggregate_by, as_index=False).mean(numeric_only=True)
+        # Keep key column; average numeric columns only. read_csv has already
+        # inferred numeric dtypes, so no per-column to_numeric pass is needed.
+        grouped = df.groupby(args.aggregate_by, as_index=False, observed=True).mean(numeric_only=True)
 
         agg_name = args.aggregate_into or f"{args.table}_agg"
-        grouped.to_sql(agg_name, conn, if_exists="replace", index=False)
+        write_frame(conn, agg_name, grouped, if_exists="replace")
         print(f"Created aggregated table '{agg_name}' grouped by '{args.aggregate_by}' ({len(grouped)} rows).")
 
+    # Let SQLite refresh any planner stats it considers stale before closing.
+    conn.execute("PRAGMA optimize;")
+    checkpoint_wal(conn)
     conn.close()
     print("Done.")
 